@@ -0,0 +1,141 @@
+"""
+Asynchronous CoinGecko client built on aiohttp.
+
+This module provides a non-blocking counterpart to CoinGeckoClient so that
+independent price requests can be issued concurrently with asyncio. The
+number of in-flight requests is bounded by a semaphore to stay within
+CoinGecko's public rate limit, and 429/5XX responses are retried with the
+same exponential backoff as the synchronous client.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from .crypto_client import (
+    CoinGeckoClient,
+    RateLimiter,
+    parse_simple_price,
+    parse_simple_prices,
+)
+
+
+class AsyncCoinGeckoClient:
+    """
+    Async implementation for CoinGecko.
+    - Callers own the aiohttp.ClientSession (see `create_session`).
+    - Fans out /simple/price calls with asyncio.gather, at most
+      `max_concurrency` at a time.
+    - Retries 429/5XX responses up to MAX_RETRIES times with backoff.
+    - Takes a token from `limiter` before every request; pass a
+      CoinGeckoClient's `limiter` so both clients share one rate budget.
+    """
+
+    BASE_URL = CoinGeckoClient.BASE_URL
+    MAX_IDS_PER_REQUEST = CoinGeckoClient.MAX_IDS_PER_REQUEST
+    RETRY_STATUSES = CoinGeckoClient.RETRY_STATUSES
+    MAX_RETRIES = CoinGeckoClient.MAX_RETRIES
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_concurrency: int = 5,
+        backoff_factor: float = CoinGeckoClient.BACKOFF_FACTOR,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_concurrency = max_concurrency
+        self.backoff_factor = backoff_factor
+        self.limiter = limiter or RateLimiter(
+            CoinGeckoClient.RATE_LIMIT_PER_MINUTE / 60, CoinGeckoClient.RATE_LIMIT_BURST
+        )
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """Creates a session to be shared by all requests of one batch."""
+        return aiohttp.ClientSession(
+            timeout=self.timeout,
+            headers={"User-Agent": CoinGeckoClient.USER_AGENT},
+        )
+
+    async def _fetch_simple_price(
+        self,
+        session: aiohttp.ClientSession,
+        coin_ids: List[str],
+        vs_currency: str,
+    ) -> Dict[str, Any]:
+        """
+        Calls the /simple/price endpoint for one or more comma-joined coin ids.
+        Raises RuntimeError if the request fails after all retries.
+        """
+        endpoint = f"{self.BASE_URL}/simple/price"
+        params = {"ids": ",".join(coin_ids), "vs_currencies": vs_currency}
+
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.limiter.reserve())
+            try:
+                async with session.get(endpoint, params=params) as response:
+                    if response.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                        response.raise_for_status()
+                        return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                raise RuntimeError(f"Failed to call CoinGecko API after retries: {exc}") from exc
+            except ValueError as exc:
+                raise RuntimeError("Failed to parse JSON from CoinGecko price response.") from exc
+
+            # Back off outside `async with` so the connection returns to the pool
+            await asyncio.sleep(self.backoff_factor * 2**attempt)
+            attempt += 1
+
+    async def get_price(
+        self,
+        session: aiohttp.ClientSession,
+        coin_id: str,
+        vs_currency: str = "usd",
+    ) -> float:
+        """
+        Fetch current price for a single coin from CoinGecko.
+        Raises RuntimeError if the request fails or the price is missing.
+        """
+        data = await self._fetch_simple_price(session, [coin_id], vs_currency)
+        return parse_simple_price(data, coin_id, vs_currency)
+
+    async def get_prices(
+        self,
+        session: aiohttp.ClientSession,
+        coin_ids: List[str],
+        vs_currency: str = "usd",
+    ) -> Dict[str, float]:
+        """
+        Fetch current prices for many coins, sending each chunk of
+        MAX_IDS_PER_REQUEST ids as a concurrent request.
+        Follows the BaseCryptoClient.get_prices failure contract: coins from
+        failed chunks are omitted, and RuntimeError is raised only if every
+        request fails after all retries.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [
+            coin_ids[start:start + self.MAX_IDS_PER_REQUEST]
+            for start in range(0, len(coin_ids), self.MAX_IDS_PER_REQUEST)
+        ]
+
+        async def fetch(batch: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_simple_price(session, batch, vs_currency)
+
+        responses = await asyncio.gather(
+            *(fetch(batch) for batch in batches), return_exceptions=True
+        )
+
+        errors = [resp for resp in responses if isinstance(resp, Exception)]
+        if batches and len(errors) == len(batches):
+            raise errors[0]
+
+        prices: Dict[str, float] = {}
+        for batch, data in zip(batches, responses):
+            if not isinstance(data, Exception):
+                prices.update(parse_simple_prices(data, batch, vs_currency))
+
+        return prices
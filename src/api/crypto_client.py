@@ -3,12 +3,18 @@ Abstract base classes and concrete implementation for a crypto price client.
 
 This module defines the interface for a crypto client and provides a
 concrete implementation using the CoinGecko API. It includes features
-like request retries with exponential backoff.
+like request retries with exponential backoff and short-lived caching of
+prices and the coin list.
 """
 from __future__ import annotations
 
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -20,6 +26,11 @@ class BaseCryptoClient(ABC):
     Abstract base class for any crypto price provider.
     """
 
+    # Concurrent get_price calls in the default get_prices; kept low to stay
+    # under typical free-tier rate limits (e.g. CoinGecko's 50 req/min).
+    # Override per instance (e.g. 1) for deterministic, sequential fetching.
+    MAX_FALLBACK_WORKERS = 5
+
     @abstractmethod
     def get_price(self, coin_id: str, vs_currency: str = "usd") -> float:
         """
@@ -28,6 +39,42 @@ class BaseCryptoClient(ABC):
         """
         raise NotImplementedError
 
+    def get_prices(self, coin_ids: List[str], vs_currency: str = "usd") -> Dict[str, float]:
+        """
+        Return a mapping from coin_id to its current price in `vs_currency`.
+
+        Every implementation follows the same failure contract: coins whose
+        price cannot be fetched (a failed request or a missing/malformed
+        price) are omitted, so callers always get the partial result.
+        RuntimeError is raised only if every request fails.
+
+        Providers with a multi-coin endpoint should override this default,
+        which issues one `get_price` call per coin on a small thread pool
+        (the calls are I/O-bound, so threads overlap their network waits).
+        """
+        if not coin_ids:
+            return {}
+
+        prices: Dict[str, float] = {}
+        errors: List[RuntimeError] = []
+        workers = min(self.MAX_FALLBACK_WORKERS, len(coin_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.get_price, coin_id, vs_currency): coin_id
+                for coin_id in coin_ids
+            }
+            for future in as_completed(futures):
+                try:
+                    prices[futures[future]] = future.result()
+                except RuntimeError as exc:
+                    errors.append(exc)
+
+        if len(errors) == len(coin_ids):
+            raise errors[0]
+
+        # Futures finish in any order; keep the caller's ordering
+        return {coin_id: prices[coin_id] for coin_id in coin_ids if coin_id in prices}
+
     @abstractmethod
     def get_supported_coins(self) -> Dict[str, str]:
         """
@@ -44,76 +91,287 @@ class BaseCryptoClient(ABC):
         raise NotImplementedError
 
 
+def parse_simple_price(data: Dict[str, Any], coin_id: str, vs_currency: str) -> float:
+    """
+    Extracts one coin's price from a CoinGecko /simple/price response.
+    Raises RuntimeError if the price is missing or malformed.
+    """
+    if not data or coin_id not in data or vs_currency not in data[coin_id]:
+        raise RuntimeError(
+            f"Price not found in CoinGecko response for coin_id='{coin_id}', "
+            f"vs_currency='{vs_currency}'. Raw response: {data}"
+        )
+
+    price_value = data[coin_id][vs_currency]
+
+    try:
+        return float(price_value)
+    except (TypeError, ValueError) as exc:
+        raise RuntimeError(f"Unexpected price format from CoinGecko: {price_value!r}") from exc
+
+
+def parse_simple_prices(
+    data: Dict[str, Any], coin_ids: List[str], vs_currency: str
+) -> Dict[str, float]:
+    """
+    Extracts the prices of `coin_ids` from a CoinGecko /simple/price response.
+    Coins with a missing or malformed price are omitted.
+    """
+    prices: Dict[str, float] = {}
+    for coin_id in coin_ids:
+        try:
+            prices[coin_id] = parse_simple_price(data, coin_id, vs_currency)
+        except RuntimeError:
+            continue
+    return prices
+
+
+class _TTLCache:
+    """
+    Minimal in-memory cache whose entries expire after a per-entry TTL.
+    Stores {key: (expires_at, value)} using time.monotonic() timestamps.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Returns the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            # pop, not del: concurrent readers may evict the same entry
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Caches `value` under `key` for `ttl` seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Drops every cached entry."""
+        self._entries.clear()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: refills at `rate_per_sec` tokens per second and
+    holds at most `capacity` tokens. Each outbound request takes one token,
+    waiting until one is available. One instance can be shared by the sync
+    and async clients (see AsyncCoinGeckoClient) to keep a single budget.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float) -> None:
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds to wait before sending.
+        The token is owed when the bucket is empty, so concurrent callers
+        queue up behind each other instead of sharing one refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
 class CoinGeckoClient(BaseCryptoClient):
     """
     Concrete implementation for CoinGecko with a resilient session.
     - Uses a requests.Session for connection pooling.
     - Implements retry logic with exponential backoff for robustness.
+    - Caches get_price results for PRICE_TTL seconds and the coin list
+      for COIN_LIST_TTL seconds, persisting the latter to disk.
+    - Throttles outbound calls with a token bucket so bursts stay under
+      the free-tier rate limit instead of triggering 429 retries.
     """
 
     BASE_URL = "https://api.coingecko.com/api/v3"
+    USER_AGENT = "crypto_monitor"
+    # CoinGecko accepts roughly 100 comma-separated ids per /simple/price call
+    MAX_IDS_PER_REQUEST = 100
+
+    # Retry 5XX errors and 429 (rate limit), sleeping 1s, 2s, 4s between attempts
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 1
+
+    # CoinGecko's public API allows about 50 calls per minute
+    RATE_LIMIT_PER_MINUTE = 50
+    RATE_LIMIT_BURST = 5
 
-    def __init__(self, timeout: int = 10):
+    PRICE_TTL = 30
+    COIN_LIST_TTL = 24 * 60 * 60
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "crypto_monitor"
+
+    def __init__(self, timeout: int = 10, cache_dir: Optional[Path] = None):
         self.session = self._create_resilient_session()
         self.timeout = timeout
+        self.limiter = RateLimiter(self.RATE_LIMIT_PER_MINUTE / 60, self.RATE_LIMIT_BURST)
+        self._cache = _TTLCache()
+        self._coin_list_path = (cache_dir or self.DEFAULT_CACHE_DIR) / "coins.json"
+
+    def invalidate(self) -> None:
+        """Clears all cached prices and the coin list, including the disk copy."""
+        self._cache.clear()
+        try:
+            self._coin_list_path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
     @staticmethod
     def _create_resilient_session() -> requests.Session:
         """Creates a session with retry logic."""
         session = requests.Session()
-        # Retry on 5XX errors and 429 (rate limit)
+        session.headers["User-Agent"] = CoinGeckoClient.USER_AGENT
         retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1  # e.g., sleep for 1s, 2s, 4s
+            total=CoinGeckoClient.MAX_RETRIES,
+            status_forcelist=CoinGeckoClient.RETRY_STATUSES,
+            backoff_factor=CoinGeckoClient.BACKOFF_FACTOR,
+        )
+        # Keep-alive pool sized for the concurrent fallback fetches
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=retry_strategy,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("https://", adapter)
         return session
 
-    def get_price(self, coin_id: str, vs_currency: str = "usd") -> float:
+    def _fetch_simple_price(self, coin_ids: List[str], vs_currency: str) -> Dict[str, Any]:
         """
-        Fetch current price for a single coin from CoinGecko.
+        Calls the /simple/price endpoint for one or more comma-joined coin ids.
         Raises RuntimeError if the request fails after all retries.
         """
         endpoint = f"{self.BASE_URL}/simple/price"
-        params = {"ids": coin_id, "vs_currencies": vs_currency}
+        params = {"ids": ",".join(coin_ids), "vs_currencies": vs_currency}
 
+        self.limiter.acquire()
         try:
             response = self.session.get(endpoint, params=params, timeout=self.timeout)
             response.raise_for_status()  # Will raise HTTPError for non-2xx responses
         except requests.RequestException as exc:
             raise RuntimeError(f"Failed to call CoinGecko API after retries: {exc}") from exc
 
-        data: Dict[str, Any] = response.json()
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise RuntimeError("Failed to parse JSON from CoinGecko price response.") from exc
+
+    def get_price(self, coin_id: str, vs_currency: str = "usd") -> float:
+        """
+        Fetch current price for a single coin from CoinGecko.
+        Raises RuntimeError if the request fails after all retries.
+        """
+        cache_key = ("price", coin_id, vs_currency)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        data = self._fetch_simple_price([coin_id], vs_currency)
+        price = parse_simple_price(data, coin_id, vs_currency)
+        self._cache.set(cache_key, price, self.PRICE_TTL)
+        return price
+
+    def get_prices(self, coin_ids: List[str], vs_currency: str = "usd") -> Dict[str, float]:
+        """
+        Fetch current prices for many coins using the multi-id /simple/price call.
+        Ids are sent in chunks of MAX_IDS_PER_REQUEST, so N coins cost
+        ceil(N / MAX_IDS_PER_REQUEST) requests instead of N.
+        Never served from the price cache: callers record the result as new
+        snapshots, so every coin is fetched live (the results still refresh
+        the cache used by `get_price`).
+        Follows the BaseCryptoClient.get_prices failure contract: coins from
+        failed chunks are omitted, and RuntimeError is raised only if every
+        request fails after all retries.
+        """
+        prices: Dict[str, float] = {}
+        errors: List[RuntimeError] = []
+
+        batches = [
+            coin_ids[start:start + self.MAX_IDS_PER_REQUEST]
+            for start in range(0, len(coin_ids), self.MAX_IDS_PER_REQUEST)
+        ]
+        for batch in batches:
+            try:
+                data = self._fetch_simple_price(batch, vs_currency)
+            except RuntimeError as exc:
+                errors.append(exc)
+                continue
 
-        if not data or coin_id not in data or vs_currency not in data[coin_id]:
-            raise RuntimeError(
-                f"Price not found in CoinGecko response for coin_id='{coin_id}', "
-                f"vs_currency='{vs_currency}'. Raw response: {data}"
-            )
+            for coin_id, price in parse_simple_prices(data, batch, vs_currency).items():
+                prices[coin_id] = price
+                self._cache.set(("price", coin_id, vs_currency), price, self.PRICE_TTL)
 
-        price_value = data[coin_id][vs_currency]
+        if batches and len(errors) == len(batches):
+            raise errors[0]
+        return prices
 
+    def _load_coin_list_from_disk(self) -> Optional[list[dict]]:
+        """Returns the persisted coin list if it is younger than COIN_LIST_TTL."""
         try:
-            return float(price_value)
-        except (TypeError, ValueError) as exc:
-            raise RuntimeError(f"Unexpected price format from CoinGecko: {price_value!r}") from exc
+            age = time.time() - self._coin_list_path.stat().st_mtime
+            if age >= self.COIN_LIST_TTL:
+                return None
+            with self._coin_list_path.open("r", encoding="utf-8") as fh:
+                coins = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return coins if isinstance(coins, list) else None
+
+    def _save_coin_list_to_disk(self, coins: list[dict]) -> None:
+        """Persists the coin list so it survives process restarts (best effort)."""
+        try:
+            self._coin_list_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._coin_list_path.open("w", encoding="utf-8") as fh:
+                json.dump(coins, fh)
+        except OSError:
+            pass
 
     def get_supported_coins_with_details(self) -> list[dict]:
         """
         Fetches the full list of coins from CoinGecko.
         Returns a list of dicts, each with id, symbol, and name.
+        The list is served from memory or disk while younger than COIN_LIST_TTL.
         """
-        endpoint = f"{self.BASE_URL}/coins/list"
-        try:
-            response = self.session.get(endpoint, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as exc:
-            raise RuntimeError(f"Failed to fetch supported coins after retries: {exc}") from exc
-        except ValueError as exc:
-            raise RuntimeError("Failed to parse JSON from CoinGecko coin list.") from exc
+        cached = self._cache.get("coin_list")
+        if cached is not None:
+            return cached
+
+        coins = self._load_coin_list_from_disk()
+        if coins is None:
+            endpoint = f"{self.BASE_URL}/coins/list"
+            self.limiter.acquire()
+            try:
+                response = self.session.get(endpoint, timeout=self.timeout)
+                response.raise_for_status()
+                coins = response.json()
+            except requests.RequestException as exc:
+                raise RuntimeError(
+                    f"Failed to fetch supported coins after retries: {exc}"
+                ) from exc
+            except ValueError as exc:
+                raise RuntimeError("Failed to parse JSON from CoinGecko coin list.") from exc
+            self._save_coin_list_to_disk(coins)
+
+        self._cache.set("coin_list", coins, self.COIN_LIST_TTL)
+        return coins
 
     def get_supported_coins(self) -> Dict[str, str]:
         """
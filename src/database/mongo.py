@@ -2,62 +2,109 @@
 Handles MongoDB connection setup and lifecycle.
 
 This module provides a MongoDBConnection class to manage connections
-and a helper function to create a default connection using environment
-variables.
+and a helper function returning a shared default connection configured
+from environment variables.
 """
 from __future__ import annotations
 
 import os
-from typing import Optional
+from functools import cache
+from typing import Optional, Type
 
-from mongoengine import connect, disconnect
+from mongoengine import Document, connect, disconnect
 
 
 class MongoDBConnection:
     """
     Handles the MongoDB connection lifecycle using a URI for flexibility.
+    Pool settings are forwarded to the underlying pymongo MongoClient so
+    connections are reused instead of re-established on the hot path.
+    A connection may be shared: each connect() must be paired with a
+    disconnect(), and the client is only closed by the last one.
     """
 
-    def __init__(self, uri: str, db_name: str) -> None:
+    def __init__(
+        self,
+        uri: str,
+        db_name: str,
+        max_pool_size: int = 50,
+        min_pool_size: int = 5,
+        server_selection_timeout_ms: int = 3000,
+    ) -> None:
         self.uri = uri
         self.db_name = db_name
-        self._connected: bool = False
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.server_selection_timeout_ms = server_selection_timeout_ms
+        self._users: int = 0
 
     def connect(self) -> None:
-        """Establishes the database connection if not already connected."""
-        if self._connected:
+        """Registers a user of the connection, configuring it for the first one."""
+        self._users += 1
+        if self._users > 1:
             return
-        # mongoengine's connect function can take a host URI
-        connect(db=self.db_name, host=self.uri)
-        self._connected = True
-        print("🔌 Database connection established.")
+        # mongoengine's connect function can take a host URI; the client
+        # connects lazily on first operation (connect=False).
+        connect(
+            db=self.db_name,
+            host=self.uri,
+            maxPoolSize=self.max_pool_size,
+            minPoolSize=self.min_pool_size,
+            serverSelectionTimeoutMS=self.server_selection_timeout_ms,
+            connect=False,
+        )
+        # Nothing has reached the server yet; the first query does
+        print(f"🔌 Database client configured for '{self.db_name}'.")
+
+    def ensure_indexes(self, *documents: Type[Document]) -> None:
+        """Creates the indexes declared in each document's meta (idempotent)."""
+        for document in documents:
+            document.ensure_indexes()
 
     def disconnect(self) -> None:
-        """Closes the database connection if it is open."""
-        if self._connected:
+        """Releases one user of the connection, closing it when none remain."""
+        if self._users == 0:
+            return
+        self._users -= 1
+        if self._users == 0:
             disconnect()
-            self._connected = False
             print("🔌 Database connection closed.")
 
 
+def _int_from_env(name: str, default: int) -> int:
+    """Reads a non-negative integer from the environment, else `default`."""
+    value: Optional[str] = os.getenv(name)
+    return int(value) if value and value.isdigit() else default
+
+
+@cache
 def get_default_connection() -> MongoDBConnection:
     """
-    Initializes a MongoDB connection using environment variables.
+    Returns the shared MongoDB connection, configured from environment variables.
 
     Prioritizes MONGO_URI for full connection string, but falls back to
     individual MONGO_HOST, MONGO_PORT, and MONGO_DB_NAME for local dev.
+    Pool settings can be overridden with MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE, and MONGO_SERVER_SELECTION_TIMEOUT_MS.
+
+    The connection is created once per process so every caller reuses the
+    same MongoClient and its pool.
     """
     db_name = os.getenv("MONGO_DB_NAME", "crypto_monitor")
+    pool_options = {
+        "max_pool_size": _int_from_env("MONGO_MAX_POOL_SIZE", 50),
+        "min_pool_size": _int_from_env("MONGO_MIN_POOL_SIZE", 5),
+        "server_selection_timeout_ms": _int_from_env("MONGO_SERVER_SELECTION_TIMEOUT_MS", 3000),
+    }
 
     # Prioritize full URI for production-like environments (e.g., MongoDB Atlas)
     if mongo_uri := os.getenv("MONGO_URI"):
-        return MongoDBConnection(uri=mongo_uri, db_name=db_name)
+        return MongoDBConnection(uri=mongo_uri, db_name=db_name, **pool_options)
 
     # Fallback for local development
     host = os.getenv("MONGO_HOST", "localhost")
-    port_str: Optional[str] = os.getenv("MONGO_PORT")
-    port = int(port_str) if port_str and port_str.isdigit() else 27017
+    port = _int_from_env("MONGO_PORT", 27017)
 
     local_uri = f"mongodb://{host}:{port}/"
 
-    return MongoDBConnection(uri=local_uri, db_name=db_name)
+    return MongoDBConnection(uri=local_uri, db_name=db_name, **pool_options)
@@ -6,10 +6,13 @@ the crypto tracking and analysis services.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from mongoengine.errors import DoesNotExist
+from pymongo.errors import PyMongoError
 
+from .api.async_crypto_client import AsyncCoinGeckoClient
 from .api.crypto_client import CoinGeckoClient
 from .services.tracker import CryptoTracker
 
@@ -42,11 +45,12 @@ def handle_list_coins(tracker: CryptoTracker):
 
     print("\n--- Tracked Coins ---")
     for coin in coins:
-        print(f"• {coin.name} ({coin.symbol.upper()})")
+        status = "" if coin.is_active else "  [inactive: prices not recorded]"
+        print(f"• {coin.name} ({coin.symbol.upper()}){status}")
 
 def handle_record_prices(tracker: CryptoTracker):
     """Initiates price recording for all tracked coins."""
-    tracker.record_prices_for_all_tracked()
+    asyncio.run(tracker.record_prices_for_all_tracked_async())
 
 def handle_market_analytics(tracker: CryptoTracker):
     """Handles the market analytics feature."""
@@ -139,6 +143,23 @@ def handle_delete_coin(tracker: CryptoTracker):
     tracker.delete_tracked_coin(coin_id, delete_prices)
     logging.info("✅ Successfully deleted '%s'.", coin_id)
 
+def handle_toggle_coin(tracker: CryptoTracker):
+    """Activates or deactivates price recording for a tracked coin."""
+    coin_id = input("Enter coin_id to activate/deactivate: ").strip().lower()
+    if not coin_id:
+        raise ValueError("Coin ID cannot be empty.")
+
+    current = next(
+        (coin for coin in tracker.list_tracked_coins() if coin.coin_id == coin_id), None
+    )
+    if current is None:
+        raise ValueError(f"Tracked coin with id='{coin_id}' not found.")
+
+    coin = tracker.update_tracked_coin_status(coin_id, is_active=not current.is_active)
+    logging.info(
+        "✅ '%s' is now %s.", coin.coin_id, "active" if coin.is_active else "inactive"
+    )
+
 # ===================================
 # Main Application Loop
 # ===================================
@@ -156,13 +177,20 @@ def print_menu() -> None:
     print("║ 5) Trend & Volatility Analysis        ║")
     print("║                                       ║")
     print("║ 6) Delete a Tracked Coin              ║")
+    print("║ 7) Activate/Deactivate a Coin         ║")
     print("║ 0) Exit                               ║")
     print("╚═══════════════════════════════════════╝")
 
 def main() -> None:
     """Main application entry point and loop."""
     client = CoinGeckoClient()
-    tracker = CryptoTracker(client=client)
+    # Both clients draw from one token bucket, so they share the rate budget
+    async_client = AsyncCoinGeckoClient(limiter=client.limiter)
+    try:
+        tracker = CryptoTracker(client=client, async_client=async_client)
+    except PyMongoError as e:
+        logging.error("❌ Could not connect to the database: %s", e)
+        return
 
     actions = {
         "1": handle_add_coin,
@@ -171,6 +199,7 @@ def main() -> None:
         "4": handle_market_analytics,
         "5": handle_trend_analysis,
         "6": handle_delete_coin,
+        "7": handle_toggle_coin,
     }
 
     try:
@@ -23,7 +23,7 @@ from mongoengine import (
 # ------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TrackedCoin:
     """
     Represents a coin that the user wants to track.
@@ -34,7 +34,7 @@ class TrackedCoin:
     is_active: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class CoinPrice:
     """
     Pure Python dataclass used by business logic to represent
@@ -56,7 +56,7 @@ class TrackedCoinDocument(Document):
     """
     meta = {
         "collection": "tracked_coins",
-        "indexes": ["coin_id", "symbol"],
+        "indexes": ["symbol"],
         "strict": False,  # Allow documents with extra fields (like old 'is_active')
     }
 
@@ -81,7 +81,8 @@ class CoinPriceDocument(Document):
     """
     meta = {
         "collection": "coin_prices",
-        "indexes": ["coin_id", "timestamp"],
+        # Serves every "last N records for coin X" query as an index range scan
+        "indexes": [{"fields": ["coin_id", "-timestamp"]}],
         "strict": False,
     }
 
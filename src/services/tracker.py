@@ -9,12 +9,21 @@ database, and performing market analysis.
 from __future__ import annotations
 
 import logging
-import statistics
+import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from mongoengine import ValidationError
+import numpy as np
+from mongoengine import NotUniqueError, ValidationError
+from pymongo.errors import PyMongoError
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; analytics fall back to NumPy/Python
+    njit = None
 
 from ..api.crypto_client import BaseCryptoClient
 from ..database.mongo import MongoDBConnection, get_default_connection
@@ -25,14 +34,14 @@ from ..models.coin import (
     TrackedCoinDocument,
 )
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if TYPE_CHECKING:  # only for annotations; avoids importing aiohttp at runtime
+    from ..api.async_crypto_client import AsyncCoinGeckoClient
 
 # =========================
 # Analytics Data Structures
 # =========================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 # pylint: disable=too-many-instance-attributes
 class MarketAnalytics:
     """Holds aggregated analytics for a coin over a window of time."""
@@ -45,7 +54,7 @@ class MarketAnalytics:
     average_price: float
     net_change_percent: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrendAnalysis:
     """Holds trend and volatility analysis for a coin."""
     coin_id: str
@@ -56,59 +65,191 @@ class TrendAnalysis:
     net_change_percent: float
 
 
-MAJOR_COINS = {
-    "bitcoin": {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
-    "btc": {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
-    "ethereum": {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
-    "eth": {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
-    "solana": {"id": "solana", "symbol": "sol", "name": "Solana"},
-    "sol": {"id": "solana", "symbol": "sol", "name": "Solana"},
-    "ripple": {"id": "ripple", "symbol": "xrp", "name": "Ripple"},
-    "xrp": {"id": "ripple", "symbol": "xrp", "name": "Ripple"},
-    "cardano": {"id": "cardano", "symbol": "ada", "name": "Cardano"},
-    "ada": {"id": "cardano", "symbol": "ada", "name": "Cardano"},
-    "dogecoin": {"id": "dogecoin", "symbol": "doge", "name": "Dogecoin"},
-    "doge": {"id": "dogecoin", "symbol": "doge", "name": "Dogecoin"},
-    "binancecoin": {"id": "binancecoin", "symbol": "bnb", "name": "Binance Coin"},
-    "bnb": {"id": "binancecoin", "symbol": "bnb", "name": "Binance Coin"},
-}
+# Real tickers are short and alphanumeric (rejects e.g. "spam.x", "usdc.e")
+_VALID_SYMBOL_RE = re.compile(r"\A[a-z0-9]{1,10}\Z")
+
+# Coins whose name contains any of these are derivatives/spam, not real assets
+_BLOCKLIST_KEYWORDS = ("-peg", "wrapped", "token", "staked")
+_BLOCKLIST_RE = re.compile("|".join(re.escape(kw) for kw in _BLOCKLIST_KEYWORDS))
+
+# Below this many prices, array conversion (and the JIT call) cost more than the work
+NUMPY_MIN_WINDOW = 50
+
+
+def _trend_kernel(prices) -> tuple[float, float, float, float]:
+    """
+    Returns (mean, sample std, least-squares slope, net change %) for a
+    newest-first price window (a list or float64 array), using scalar loops
+    that numba compiles to native code. Requires at least 2 prices.
+    """
+    n = len(prices)
+    sum_y = 0.0
+    sum_xy = 0.0
+    for i in range(n):
+        sum_y += prices[i]
+        sum_xy += i * prices[i]
+    mean_price = sum_y / n
+
+    squared_dev = 0.0
+    for i in range(n):
+        dev = prices[i] - mean_price
+        squared_dev += dev * dev
+    std_dev = (squared_dev / (n - 1)) ** 0.5
+
+    # Closed forms for sum(range(n)) and sum(i**2 for i in range(n))
+    sum_x = n * (n - 1) / 2.0
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6.0
+    denominator = n * sum_x2 - sum_x * sum_x
+    slope = (n * sum_xy - sum_x * sum_y) / denominator if denominator != 0 else 0.0
+
+    # Newest first: the last price opens the window, the first closes it
+    open_price = prices[n - 1]
+    net_change = ((prices[0] - open_price) / open_price) * 100.0 if open_price != 0 else 0.0
+
+    return mean_price, std_dev, slope, net_change
+
+
+def _vectorized_trend_stats(values: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    NumPy equivalent of `_trend_kernel` for a float64 array, used for long
+    windows when numba is not installed.
+    """
+    n = values.size
+    sum_x = n * (n - 1) / 2.0
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6.0
+    denominator = n * sum_x2 - sum_x * sum_x
+    sum_xy = float(np.arange(n, dtype=np.float64) @ values)
+    slope = (n * sum_xy - sum_x * float(values.sum())) / denominator if denominator else 0.0
+
+    open_price = float(values[-1])
+    net_change = ((float(values[0]) - open_price) / open_price) * 100.0 if open_price else 0.0
+
+    return float(values.mean()), float(values.std(ddof=1)), slope, net_change
+
+
+# JIT-compiled kernel for long windows, or None when numba is not installed
+_compiled_trend_kernel = (
+    njit(cache=True, fastmath=True)(_trend_kernel) if njit is not None else None
+)
+
+_MAJOR_COIN_LIST = (
+    {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
+    {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
+    {"id": "solana", "symbol": "sol", "name": "Solana"},
+    {"id": "ripple", "symbol": "xrp", "name": "Ripple"},
+    {"id": "cardano", "symbol": "ada", "name": "Cardano"},
+    {"id": "dogecoin", "symbol": "doge", "name": "Dogecoin"},
+    {"id": "binancecoin", "symbol": "bnb", "name": "Binance Coin"},
+)
+
+# Read-only lookup by id or symbol, built once at import
+MAJOR_COINS = MappingProxyType({
+    key: coin for coin in _MAJOR_COIN_LIST for key in (coin["id"], coin["symbol"])
+})
 
 
 class CryptoTracker:
     """High-level service for tracking and analyzing crypto prices."""
 
+    # Seconds a fetched coin list is reused by search before asking the client again
+    COIN_LIST_TTL = 300
+
     def __init__(
         self,
         client: BaseCryptoClient,
         connection: Optional[MongoDBConnection] = None,
+        async_client: Optional[AsyncCoinGeckoClient] = None,
     ) -> None:
         self.client = client
-        self.connection = connection or get_default_connection()
+        self.async_client = async_client
+        # (fetched_at, coins) from the client, reused for COIN_LIST_TTL seconds
+        self._coin_list_cache: Optional[tuple[float, list[dict]]] = None
+        # Search index over the client's coin list, rebuilt when the list changes
+        self._indexed_catalog: Optional[list[dict]] = None
+        self._search_index: Dict[str, list[dict]] = {}
+        # Tracked coins only change through this service; reset on every write
+        self._tracked_cache: Optional[List[TrackedCoin]] = None
+        self.connection = connection if connection is not None else get_default_connection()
         self.connection.connect()
+        try:
+            # First round-trip to the server; fails if MongoDB is unreachable
+            self.connection.ensure_indexes(TrackedCoinDocument, CoinPriceDocument)
+        except PyMongoError:
+            self.connection.disconnect()
+            raise
 
     # =========================
     # Tracked Coins CRUD
     # =========================
 
     def add_tracked_coin(self, *, coin_id: str, symbol: str, name: str) -> TrackedCoin:
-        """Creates a new tracked coin entry."""
-        if TrackedCoinDocument.objects(coin_id=coin_id).first():
+        """
+        Creates a new tracked coin entry.
+        The existence check and insert are a single atomic upsert; coins
+        already in the tracked cache are rejected without a round-trip.
+        """
+        if self._tracked_cache is not None and any(
+            coin.coin_id == coin_id for coin in self._tracked_cache
+        ):
             raise ValueError(f"Coin with id='{coin_id}' is already tracked.")
+
+        doc = TrackedCoinDocument(coin_id=coin_id, symbol=symbol.lower(), name=name)
         try:
-            doc = TrackedCoinDocument(coin_id=coin_id, symbol=symbol.lower(), name=name)
-            doc.save()
-            logging.info("Added new tracked coin: %s (%s)", name, symbol)
-            return doc.to_dataclass()
+            doc.validate()
         except ValidationError as exc:
             raise ValueError(f"Invalid data for new coin: {exc}") from exc
 
-    def list_tracked_coins(self) -> List[TrackedCoin]:
-        """Returns all tracked coins."""
-        return [doc.to_dataclass() for doc in TrackedCoinDocument.objects.order_by("name")]
+        try:
+            result = TrackedCoinDocument.objects(coin_id=coin_id).update_one(
+                upsert=True,
+                full_result=True,
+                set_on_insert__symbol=doc.symbol,
+                set_on_insert__name=doc.name,
+                set_on_insert__is_active=doc.is_active,
+            )
+        except NotUniqueError:
+            result = None
+
+        if result is None or result.upserted_id is None:
+            raise ValueError(f"Coin with id='{coin_id}' is already tracked.")
+
+        self._tracked_cache = None
+        logging.info("Added new tracked coin: %s (%s)", name, symbol)
+        return doc.to_dataclass()
+
+    def list_tracked_coins(self, active_only: bool = False) -> List[TrackedCoin]:
+        """
+        Returns all tracked coins, or only the active ones if `active_only`.
+        Reads raw projected dicts to skip full document hydration, and serves
+        repeat calls from memory until a tracked coin is added, updated, or deleted.
+        """
+        if self._tracked_cache is None:
+            self._tracked_cache = self._load_tracked_coins()
+        if active_only:
+            return [coin for coin in self._tracked_cache if coin.is_active]
+        return list(self._tracked_cache)
+
+    def _load_tracked_coins(self) -> List[TrackedCoin]:
+        """Queries tracked coins, projecting only the fields TrackedCoin needs."""
+        rows = (
+            TrackedCoinDocument.objects.order_by("name")
+            .only("coin_id", "symbol", "name", "is_active")
+            .as_pymongo()
+        )
+        return [
+            TrackedCoin(
+                coin_id=row["coin_id"],
+                symbol=row["symbol"],
+                name=row["name"],
+                is_active=row.get("is_active", True),
+            )
+            for row in rows
+        ]
 
     def delete_tracked_coin(self, coin_id: str, delete_prices: bool = False) -> None:
         """Deletes a tracked coin and optionally its price history."""
         deleted_count = TrackedCoinDocument.objects(coin_id=coin_id).delete()
+        self._tracked_cache = None
         if deleted_count == 0:
             raise ValueError(f"Tracked coin with id='{coin_id}' not found.")
         logging.info("Deleted tracked coin '%s'.", coin_id)
@@ -117,40 +258,97 @@ class CryptoTracker:
             deleted_prices = CoinPriceDocument.objects(coin_id=coin_id).delete()
             logging.info("Deleted %s price records for '%s'.", deleted_prices, coin_id)
 
+    def update_tracked_coin_status(self, coin_id: str, is_active: bool) -> TrackedCoin:
+        """
+        Activates or deactivates a tracked coin.
+        Uses a single atomic find-and-modify instead of a load-then-save.
+        """
+        doc = TrackedCoinDocument.objects(coin_id=coin_id).modify(
+            new=True, set__is_active=is_active
+        )
+        if doc is None:
+            raise ValueError(f"Tracked coin with id='{coin_id}' not found.")
+        self._tracked_cache = None
+        logging.info(
+            "Marked tracked coin '%s' as %s.", coin_id, "active" if is_active else "inactive"
+        )
+        return doc.to_dataclass()
+
     # =========================
     # Price Snapshot Logic
     # =========================
 
+    def _persist(self, prices: List[CoinPrice]) -> list[CoinPrice]:
+        """
+        Validates price snapshots and writes them with a single bulk insert.
+        Invalid snapshots are logged and skipped; the stored ones are returned.
+        """
+        docs: list[CoinPriceDocument] = []
+        stored: list[CoinPrice] = []
+
+        for price in prices:
+            doc = CoinPriceDocument(
+                coin_id=price.coin_id, price=price.price, timestamp=price.timestamp
+            )
+            try:
+                doc.validate()
+            except ValidationError as exc:
+                logging.error("Invalid price snapshot for '%s': %s", price.coin_id, exc)
+                continue
+            docs.append(doc)
+            stored.append(price)
+
+        if not docs:
+            return stored
+
+        CoinPriceDocument.objects.insert(docs, load_bulk=False)
+        for price in stored:
+            # pylint: disable=logging-fstring-interpolation
+            logging.info(f"Recorded price for '{price.coin_id}': ${price.price:,.4f}")
+        return stored
+
     def record_price_for_coin(self, coin_id: str) -> CoinPrice:
         """Fetches and stores a single price snapshot."""
         price = self.client.get_price(coin_id)
-        timestamp = datetime.now(timezone.utc)
-        doc = CoinPriceDocument(coin_id=coin_id, price=price, timestamp=timestamp).save()
-        # pylint: disable=logging-fstring-interpolation
-        logging.info(f"Recorded price for '{coin_id}': ${price:,.4f}")
-        return doc.to_dataclass()
-
-    def record_prices_for_all_tracked(self) -> list[CoinPrice]:
-        """Fetches and stores prices for all tracked coins."""
-        prices: list[CoinPrice] = []
-        tracked_coins = self.list_tracked_coins()
+        snapshot = CoinPrice(coin_id=coin_id, price=price, timestamp=datetime.now(timezone.utc))
+        stored = self._persist([snapshot])
+        if not stored:
+            raise ValueError(f"Invalid price snapshot for '{coin_id}'.")
+        return stored[0]
 
-        if not tracked_coins:
-            logging.warning("No tracked coins to record prices for.")
-            return prices
+    def _store_prices(
+        self,
+        tracked_coins: List[TrackedCoin],
+        latest_prices: Dict[str, float],
+    ) -> list[CoinPrice]:
+        """
+        Stores one snapshot per tracked coin, sharing the same timestamp,
+        in a single bulk write.
+        """
+        snapshots: list[CoinPrice] = []
+        timestamp = datetime.now(timezone.utc)
 
-        logging.info("Starting price recording for %s coins.", len(tracked_coins))
         for tracked in tracked_coins:
-            try:
-                price = self.record_price_for_coin(tracked.coin_id)
-                prices.append(price)
-            except Exception as exc:
+            if tracked.coin_id not in latest_prices:
                 logging.error(
-                    "Failed to record price for %s (%s): %s",
+                    "Failed to record price for %s (%s): no price returned by the API.",
                     tracked.name,
                     tracked.coin_id,
-                    exc,
                 )
+                continue
+            snapshots.append(
+                CoinPrice(
+                    coin_id=tracked.coin_id,
+                    price=latest_prices[tracked.coin_id],
+                    timestamp=timestamp,
+                )
+            )
+
+        try:
+            prices = self._persist(snapshots)
+        except Exception as exc:
+            logging.error("Failed to store price snapshots: %s", exc)
+            return []
 
         logging.info(
             "Successfully recorded prices for %s of %s coins.",
@@ -158,21 +356,102 @@ class CryptoTracker:
         )
         return prices
 
+    def record_prices_for_all_tracked(self) -> list[CoinPrice]:
+        """
+        Fetches prices for all active tracked coins in a single batched API
+        call and stores one snapshot per coin, sharing the same timestamp.
+        """
+        tracked_coins = self.list_tracked_coins(active_only=True)
+
+        if not tracked_coins:
+            logging.warning("No active tracked coins to record prices for.")
+            return []
+
+        logging.info("Starting price recording for %s coins.", len(tracked_coins))
+        try:
+            latest_prices = self.client.get_prices([t.coin_id for t in tracked_coins])
+        except RuntimeError as exc:
+            logging.error("Failed to fetch prices for tracked coins: %s", exc)
+            return []
+
+        return self._store_prices(tracked_coins, latest_prices)
+
+    async def record_prices_for_all_tracked_async(self) -> list[CoinPrice]:
+        """
+        Same as `record_prices_for_all_tracked`, but fetches prices with the
+        async client so that all API requests run concurrently.
+        Falls back to the synchronous path if no async client is configured.
+        """
+        if self.async_client is None:
+            return self.record_prices_for_all_tracked()
+
+        tracked_coins = self.list_tracked_coins(active_only=True)
+
+        if not tracked_coins:
+            logging.warning("No active tracked coins to record prices for.")
+            return []
+
+        logging.info("Starting async price recording for %s coins.", len(tracked_coins))
+        try:
+            async with self.async_client.create_session() as session:
+                latest_prices = await self.async_client.get_prices(
+                    session, [t.coin_id for t in tracked_coins]
+                )
+        except RuntimeError as exc:
+            logging.error("Failed to fetch prices for tracked coins: %s", exc)
+            return []
+
+        return self._store_prices(tracked_coins, latest_prices)
+
     def get_price_history(self, coin_id: str, limit: int) -> List[CoinPrice]:
         """Gets the last N price records for a coin."""
-        price_docs = CoinPriceDocument.objects(coin_id=coin_id).order_by(
-            "-timestamp"
-        ).limit(limit)
-        return [doc.to_dataclass() for doc in price_docs]
+        rows = (
+            CoinPriceDocument.objects(coin_id=coin_id)
+            .order_by("-timestamp")
+            .limit(limit)
+            .only("price", "timestamp")
+            .as_pymongo()
+        )
+        return [
+            CoinPrice(coin_id=coin_id, price=row["price"], timestamp=row["timestamp"])
+            for row in rows
+        ]
+
+    def _get_recent_prices(self, coin_id: str, limit: int) -> list[float]:
+        """Gets the last N prices for a coin (newest first), projecting only `price`."""
+        return list(
+            CoinPriceDocument.objects(coin_id=coin_id)
+            .order_by("-timestamp")
+            .limit(limit)
+            .scalar("price")
+        )
 
     # =========================
     # New Analytics Methods
     # =========================
 
     def get_market_analytics(self, coin_id: str, limit: int) -> Optional[MarketAnalytics]:
-        """Calculates market analytics over the last N records."""
-        history = self.get_price_history(coin_id, limit)
-        actual_count = len(history)
+        """
+        Calculates market analytics over the last N records.
+        All aggregates are computed by MongoDB in a single $group stage.
+        """
+        pipeline = [
+            {"$match": {"coin_id": coin_id}},
+            {"$sort": {"timestamp": -1}},
+            {"$limit": limit},
+            {"$group": {
+                "_id": None,
+                "count": {"$sum": 1},
+                # Window is sorted newest first: first is the close, last the open
+                "close": {"$first": "$price"},
+                "open": {"$last": "$price"},
+                "high": {"$max": "$price"},
+                "low": {"$min": "$price"},
+                "avg": {"$avg": "$price"},
+            }},
+        ]
+        summary = next(iter(CoinPriceDocument.objects.aggregate(pipeline)), None)
+        actual_count = summary["count"] if summary else 0
 
         if actual_count < 2:
             logging.warning(
@@ -183,10 +462,8 @@ class CryptoTracker:
             )
             return None
 
-        prices = [item.price for item in history]
-        # History is newest first, so reverse for open/close
-        open_price = prices[-1]
-        close_price = prices[0]
+        open_price = summary["open"]
+        close_price = summary["close"]
 
         net_change = ((close_price - open_price) / open_price) * 100.0 if open_price else 0.0
 
@@ -195,18 +472,14 @@ class CryptoTracker:
             record_count=actual_count,
             open_price=open_price,
             close_price=close_price,
-            high_price=max(prices),
-            low_price=min(prices),
-            average_price=statistics.mean(prices),
+            high_price=summary["high"],
+            low_price=summary["low"],
+            average_price=summary["avg"],
             net_change_percent=net_change,
         )
 
-    def _calculate_volatility(self, prices: list[float]) -> str:
-        """Calculates the price volatility."""
-        if len(prices) < 2:
-            return "Unknown"
-        mean_price = statistics.mean(prices)
-        std_dev = statistics.stdev(prices)
+    def _calculate_volatility(self, mean_price: float, std_dev: float) -> str:
+        """Classifies volatility from the coefficient of variation."""
         coeff_var = (std_dev / mean_price) if mean_price != 0 else 0
 
         if coeff_var < 0.01:
@@ -215,20 +488,8 @@ class CryptoTracker:
             return "Medium"
         return "High"
 
-    def _calculate_trend(self, prices: list[float]) -> tuple[str, float]:
-        """Calculates the price trend and normalized slope."""
-        n = len(prices)
-        sum_x = sum(range(n))
-        sum_y = sum(prices)
-        sum_xy = sum(i * prices[i] for i in range(n))
-        sum_x2 = sum(i**2 for i in range(n))
-
-        try:
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x**2)
-        except ZeroDivisionError:
-            slope = 0
-
-        mean_price = statistics.mean(prices)
+    def _calculate_trend(self, slope: float, mean_price: float) -> tuple[str, float]:
+        """Classifies the price trend and returns it with the normalized slope."""
         norm_slope = (slope / mean_price) * 100 if mean_price != 0 else 0
 
         if norm_slope > 0.5:
@@ -251,26 +512,28 @@ class CryptoTracker:
 
     def get_trend_analysis(self, coin_id: str, limit: int) -> Optional[TrendAnalysis]:
         """Performs trend, volatility, and momentum analysis."""
-        history = self.get_price_history(coin_id, limit)
-        if len(history) < 4:
+        prices = self._get_recent_prices(coin_id, limit)
+        if len(prices) < 4:
             logging.warning(
                 "Not enough data for trend analysis for '%s'. "
                 "Need at least 4 records, but found %s.",
                 coin_id,
-                len(history),
+                len(prices),
             )
             return None
 
-        prices = [item.price for item in history]
-
-        volatility = self._calculate_volatility(prices)
-        trend, norm_slope = self._calculate_trend(prices)
+        if len(prices) >= NUMPY_MIN_WINDOW:
+            values = np.asarray(prices, dtype=np.float64)
+            if _compiled_trend_kernel is not None:
+                stats = _compiled_trend_kernel(values)
+            else:
+                stats = _vectorized_trend_stats(values)
+        else:
+            stats = _trend_kernel(prices)
+        mean_price, std_dev, slope, net_change_percent = stats
 
-        open_price = prices[-1]
-        close_price = prices[0]
-        net_change_percent = (
-            ((close_price - open_price) / open_price) * 100.0 if open_price else 0.0
-        )
+        volatility = self._calculate_volatility(mean_price, std_dev)
+        trend, norm_slope = self._calculate_trend(slope, mean_price)
         momentum_score = self._calculate_momentum(net_change_percent, norm_slope)
 
         return TrendAnalysis(
@@ -300,8 +563,35 @@ class CryptoTracker:
 
         # 2. Fallback to API search if not in the priority list
         logging.info("'%s' not in priority list, searching via API...", query)
-        all_coins = self.client.get_supported_coins_with_details()
-        results: list[dict] = []
+        return self._get_search_index().get(query, [])[:limit]
+
+    def _coin_list(self) -> list[dict]:
+        """Returns the provider's coin list, refetching at most every COIN_LIST_TTL seconds."""
+        now = time.monotonic()
+        if self._coin_list_cache is not None:
+            fetched_at, coins = self._coin_list_cache
+            if now - fetched_at < self.COIN_LIST_TTL:
+                return coins
+
+        coins = self.client.get_supported_coins_with_details()
+        self._coin_list_cache = (now, coins)
+        return coins
+
+    def _get_search_index(self) -> Dict[str, list[dict]]:
+        """Returns the search index, rebuilding it only when the coin list is refreshed."""
+        all_coins = self._coin_list()
+        if all_coins is not self._indexed_catalog:
+            self._search_index = self._build_search_index(all_coins)
+            self._indexed_catalog = all_coins
+        return self._search_index
+
+    def _build_search_index(self, all_coins: list[dict]) -> Dict[str, list[dict]]:
+        """
+        Maps every lowercased id, symbol, and name to the quality coins it
+        matches, preserving catalog order. Built once per catalog download so
+        each search is a single dict lookup.
+        """
+        index: Dict[str, list[dict]] = {}
 
         for coin in all_coins:
             symbol = coin.get("symbol", "").lower()
@@ -311,18 +601,16 @@ class CryptoTracker:
             # --- Quality and relevance filters ---
             if not all([symbol, coin_id, name]):
                 continue
-            if "." in symbol or len(symbol) > 10:
+            if not _VALID_SYMBOL_RE.match(symbol):
                 continue
-            if any(kw in name for kw in ["-peg", "wrapped", "token", "staked"]):
+            if _BLOCKLIST_RE.search(name):
                 continue
 
-            # Match query against id, symbol, or name
-            if query in (symbol, coin_id, name):
-                results.append(coin)
-                if len(results) >= limit:
-                    break
+            # A coin is listed once per distinct key it can be found by
+            for key in dict.fromkeys((symbol, coin_id, name)):
+                index.setdefault(key, []).append(coin)
 
-        return results
+        return index
 
     def add_tracked_coin_interactive(self, query: str) -> TrackedCoin:
         """Guides the user through searching for and adding a coin."""
@@ -331,8 +619,9 @@ class CryptoTracker:
             raise ValueError(f"No quality coins found for query '{query}'. "
                              "Try a different symbol or name.")
 
+        numbered = dict(enumerate(matches, start=1))
         print("\n--- Found Coins ---")
-        for i, coin in enumerate(matches, start=1):
+        for i, coin in numbered.items():
             print(f"{i}) {coin['name']} ({coin['symbol'].upper()})")
 
         # If only one match is found from the priority list, add it directly
@@ -342,21 +631,22 @@ class CryptoTracker:
         else:
             # Otherwise, prompt the user to choose
             while True:
+                choice_str = input(
+                    f"Select number to track (1-{len(matches)}, or 0 to cancel): "
+                ).strip()
                 try:
-                    choice_str = input(
-                        f"Select number to track (1-{len(matches)}, or 0 to cancel): "
-                    ).strip()
                     choice = int(choice_str)
-                    if 0 <= choice <= len(matches):
-                        break
-                    logging.error("❌ Invalid number. Please choose from the list.")
                 except ValueError:
                     logging.error("❌ Invalid input. Please enter a number. ")
+                    continue
 
-            if choice == 0:
-                raise ValueError("Operation cancelled by user.")
-
-            selected_coin = matches[choice - 1]
+                if choice == 0:
+                    raise ValueError("Operation cancelled by user.")
+                try:
+                    selected_coin = numbered[choice]
+                    break
+                except KeyError:
+                    logging.error("❌ Invalid number. Please choose from the list.")
 
         return self.add_tracked_coin(
             coin_id=selected_coin["id"],
@@ -365,5 +655,5 @@ class CryptoTracker:
         )
 
     def close(self) -> None:
-        """Cleanly close the MongoDB connection."""
+        """Releases this tracker's use of the (possibly shared) MongoDB connection."""
         self.connection.disconnect()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from src.api.async_crypto_client import AsyncCoinGeckoClient
+from src.api.crypto_client import RateLimiter
+
+
+class _FakeResponse:
+    """Minimal aiohttp response usable as `async with session.get(...)`."""
+
+    def __init__(self, status, payload):
+        self.status = status
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                request_info=MagicMock(), history=(), status=self.status
+            )
+
+    async def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    """
+    Records every requested id chunk and answers with `handler(ids)`, which
+    returns a (status, payload) pair or raises an aiohttp error.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requested = []
+
+    def get(self, endpoint, params):
+        ids = params['ids'].split(',')
+        self.requested.append(ids)
+        status, payload = self.handler(ids)
+        return _FakeResponse(status, payload)
+
+
+def _usd_prices(ids):
+    """Answers every id with a price of 1.0."""
+    return 200, {coin_id: {'usd': 1.0} for coin_id in ids}
+
+
+@pytest.fixture
+def client():
+    """Fixture for an AsyncCoinGeckoClient that retries without sleeping."""
+    return AsyncCoinGeckoClient(
+        backoff_factor=0, limiter=RateLimiter(rate_per_sec=1000.0, capacity=1000)
+    )
+
+
+def test_get_prices_chunks_more_than_max_ids(client: AsyncCoinGeckoClient):
+    """
+    Verify that more than MAX_IDS_PER_REQUEST ids are split into chunks.
+    """
+    coin_ids = [f'coin-{i}' for i in range(250)]
+    session = _FakeSession(_usd_prices)
+
+    prices = asyncio.run(client.get_prices(session, coin_ids))
+
+    assert list(prices) == coin_ids
+    assert [len(ids) for ids in session.requested] == [100, 100, 50]
+
+
+def test_get_prices_omits_coins_from_failed_chunk(client: AsyncCoinGeckoClient):
+    """
+    Verify a failed chunk only drops its own coins.
+    """
+    coin_ids = [f'coin-{i}' for i in range(150)]
+
+    def handler(ids):
+        if ids[0] == 'coin-0':
+            raise aiohttp.ClientConnectionError("boom")
+        return _usd_prices(ids)
+
+    prices = asyncio.run(client.get_prices(_FakeSession(handler), coin_ids))
+
+    assert list(prices) == coin_ids[100:]
+
+
+def test_get_prices_raises_when_every_chunk_fails(client: AsyncCoinGeckoClient):
+    """
+    Verify RuntimeError is raised only when no chunk succeeds.
+    """
+    def handler(ids):
+        raise aiohttp.ClientConnectionError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(client.get_prices(_FakeSession(handler), ['bitcoin', 'ethereum']))
+
+
+def test_fetch_retries_rate_limited_requests(client: AsyncCoinGeckoClient):
+    """
+    Verify a 429 is retried, and gives up after MAX_RETRIES retries.
+    """
+    statuses = iter([429, 503, 200])
+    session = _FakeSession(lambda ids: (next(statuses), {'bitcoin': {'usd': 65000}}))
+
+    assert asyncio.run(client.get_price(session, 'bitcoin')) == 65000.0
+    assert len(session.requested) == 3
+
+    session = _FakeSession(lambda ids: (429, {}))
+    with pytest.raises(RuntimeError, match="429"):
+        asyncio.run(client.get_price(session, 'bitcoin'))
+    assert len(session.requested) == client.MAX_RETRIES + 1
+
+
+def test_requests_share_the_given_rate_limiter(client: AsyncCoinGeckoClient):
+    """
+    Verify every request, including retries, takes a token from the limiter.
+    """
+    client.limiter = MagicMock(spec=RateLimiter)
+    client.limiter.reserve.return_value = 0.0
+    statuses = iter([429, 200])
+    session = _FakeSession(lambda ids: (next(statuses), {'bitcoin': {'usd': 65000}}))
+
+    asyncio.run(client.get_price(session, 'bitcoin'))
+
+    assert client.limiter.reserve.call_count == 2
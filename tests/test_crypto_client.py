@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from src.api import crypto_client
+from src.api.crypto_client import BaseCryptoClient, CoinGeckoClient
+
+
+MOCK_COINS_LIST = [
+    {'id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin'},
+    {'id': 'ethereum', 'symbol': 'eth', 'name': 'Ethereum'},
+]
+
+
+def _response(payload):
+    """Builds a fake requests.Response returning `payload` as JSON."""
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Fixture for a CoinGeckoClient with a mocked session and temp cache dir."""
+    service = CoinGeckoClient(cache_dir=tmp_path)
+    service.session = MagicMock()
+    return service
+
+
+def test_get_prices_batches_ids_and_skips_missing(client: CoinGeckoClient):
+    """
+    Verify that many coins are fetched with one request and missing ones are omitted.
+    """
+    client.session.get.return_value = _response({'bitcoin': {'usd': 65000}})
+
+    prices = client.get_prices(['bitcoin', 'ethereum'])
+
+    assert prices == {'bitcoin': 65000.0}
+    client.session.get.assert_called_once()
+    assert client.session.get.call_args.kwargs['params']['ids'] == 'bitcoin,ethereum'
+
+
+def test_get_price_is_served_from_cache(client: CoinGeckoClient):
+    """
+    Verify that a repeated price lookup does not hit the API until invalidated.
+    """
+    client.session.get.return_value = _response({'bitcoin': {'usd': 65000}})
+
+    assert client.get_price('bitcoin') == 65000.0
+    assert client.get_price('bitcoin') == 65000.0
+    assert client.session.get.call_count == 1
+
+    client.invalidate()
+    client.get_price('bitcoin')
+    assert client.session.get.call_count == 2
+
+
+def test_get_prices_bypasses_price_cache(client: CoinGeckoClient):
+    """
+    Verify batched fetches always hit the API, since they are recorded as new snapshots.
+    """
+    client.session.get.side_effect = [
+        _response({'bitcoin': {'usd': 65000}}),
+        _response({'bitcoin': {'usd': 66000}}),
+    ]
+
+    assert client.get_prices(['bitcoin']) == {'bitcoin': 65000.0}
+    assert client.get_prices(['bitcoin']) == {'bitcoin': 66000.0}
+    assert client.session.get.call_count == 2
+
+
+def test_get_prices_keeps_other_chunks_when_one_fails(client: CoinGeckoClient):
+    """
+    Verify a failed chunk only drops its own coins, and all chunks failing raises.
+    """
+    coin_ids = [f'coin-{i}' for i in range(150)]
+    client.session.get.side_effect = [
+        requests.ConnectionError("boom"),
+        _response({coin_id: {'usd': 1.0} for coin_id in coin_ids[100:]}),
+    ]
+
+    prices = client.get_prices(coin_ids)
+
+    assert list(prices) == coin_ids[100:]
+
+    client.invalidate()
+    client.session.get.side_effect = requests.ConnectionError("boom")
+    with pytest.raises(RuntimeError, match="boom"):
+        client.get_prices(coin_ids)
+
+
+def test_coin_list_is_persisted_to_disk(client: CoinGeckoClient, tmp_path):
+    """
+    Verify that the coin list survives a new client instance via the disk cache.
+    """
+    client.session.get.return_value = _response(MOCK_COINS_LIST)
+    assert client.get_supported_coins_with_details() == MOCK_COINS_LIST
+
+    fresh_client = CoinGeckoClient(cache_dir=tmp_path)
+    fresh_client.session = MagicMock()
+
+    assert fresh_client.get_supported_coins() == {'btc': 'bitcoin', 'eth': 'ethereum'}
+    fresh_client.session.get.assert_not_called()
+
+
+class _PerCoinClient(BaseCryptoClient):
+    """Provider without a batch endpoint, relying on the default get_prices."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_price(self, coin_id, vs_currency="usd"):
+        self.calls.append(coin_id)
+        if coin_id == 'ethereum':
+            raise RuntimeError("API failed for ethereum")
+        return 1.0
+
+    def get_supported_coins(self):
+        return {}
+
+    def get_supported_coins_with_details(self):
+        return []
+
+
+def test_default_get_prices_omits_failed_coins():
+    """
+    Verify the per-coin fallback keeps going when one coin fails.
+    """
+    prices = _PerCoinClient().get_prices(['bitcoin', 'ethereum', 'ripple'])
+
+    assert prices == {'bitcoin': 1.0, 'ripple': 1.0}
+    assert _PerCoinClient().get_prices([]) == {}
+
+    with pytest.raises(RuntimeError, match="ethereum"):
+        _PerCoinClient().get_prices(['ethereum'])
+
+
+def test_rate_limiter_waits_when_bucket_is_empty(monkeypatch):
+    """
+    Verify the token bucket allows a burst, then sleeps for the refill time.
+    """
+    now = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(crypto_client.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(crypto_client.time, 'sleep', fake_sleep)
+    limiter = crypto_client.RateLimiter(rate_per_sec=2.0, capacity=2)
+
+    limiter.acquire()
+    limiter.acquire()
+    assert sleeps == []
+
+    limiter.acquire()
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_default_get_prices_sequential_with_one_worker():
+    """
+    Verify a single-worker pool fetches coins in submission order.
+    """
+    client = _PerCoinClient()
+    client.MAX_FALLBACK_WORKERS = 1
+
+    prices = client.get_prices(['ripple', 'ethereum', 'bitcoin'])
+
+    assert client.calls == ['ripple', 'ethereum', 'bitcoin']
+    assert list(prices) == ['ripple', 'bitcoin']
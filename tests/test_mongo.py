@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.database.mongo import MongoDBConnection
+
+
+@patch('src.database.mongo.disconnect')
+@patch('src.database.mongo.connect')
+def test_shared_connection_closes_after_last_user(mock_connect, mock_disconnect):
+    """
+    Verify a connection shared by two users stays open until both release it.
+    """
+    connection = MongoDBConnection(uri="mongodb://localhost:27017/", db_name="test")
+
+    connection.connect()
+    connection.connect()
+    connection.disconnect()
+
+    mock_connect.assert_called_once()
+    mock_disconnect.assert_not_called()
+
+    connection.disconnect()
+    connection.disconnect()  # extra releases are ignored
+    mock_disconnect.assert_called_once()
@@ -1,42 +1,58 @@
 from __future__ import annotations
 
+import asyncio
+from types import MappingProxyType
+
+import numpy as np
 import pytest
-from unittest.mock import MagicMock, patch
+from pymongo.errors import ServerSelectionTimeoutError
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.api.crypto_client import BaseCryptoClient, CoinGeckoClient
+from src.database.mongo import MongoDBConnection
+from src.services import tracker as tracker_module
 from src.services.tracker import CryptoTracker
-from src.models.coin import TrackedCoin, CoinPrice
+from src.models.coin import TrackedCoin
 
 
-# Mock data from CoinGecko API
-MOCK_COINS_LIST = [
+# Mock data from CoinGecko API, read-only so the service cannot mutate it
+MOCK_COINS_LIST = tuple(MappingProxyType(coin) for coin in [
     {'id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin'},
     {'id': 'ethereum', 'symbol': 'eth', 'name': 'Ethereum'},
     {'id': 'ripple', 'symbol': 'xrp', 'name': 'XRP'},
     {'id': 'spam-coin-peg', 'symbol': 'spam.x', 'name': 'SpamCoin'},
-]
+])
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_crypto_client():
-    """Fixture for a mocked BaseCryptoClient."""
-    client = MagicMock()
+    """Fixture for a mocked BaseCryptoClient, shared by the module."""
+    client = MagicMock(spec=BaseCryptoClient)
     client.get_supported_coins_with_details.return_value = MOCK_COINS_LIST
     return client
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_db_connection():
-    """Fixture to mock the database connection."""
-    conn = MagicMock()
+    """Fixture to mock the database connection, shared by the module."""
+    conn = MagicMock(spec=MongoDBConnection)
     return conn
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tracker_service(mock_crypto_client, mock_db_connection):
     """Fixture for a CryptoTracker service instance with a mocked client and DB."""
-    # We disable the real DB connection for unit tests
-    with patch('src.services.tracker.get_default_connection', return_value=mock_db_connection):
-        service = CryptoTracker(client=mock_crypto_client)
-        # Prevent the real connect() from being called in tests
-        service.connection.connect = MagicMock()
-        return service
+    # Inject the mocked connection so the real DB is never touched
+    return CryptoTracker(client=mock_crypto_client, connection=mock_db_connection)
+
+@pytest.fixture(autouse=True)
+def _reset_shared_fixtures(tracker_service, mock_crypto_client, mock_db_connection):
+    """Restores the module-scoped service and mocks after each test."""
+    initial_state = dict(vars(tracker_service))
+    yield
+    # Drops instance overrides (e.g. mocked methods) and resets the caches
+    vars(tracker_service).clear()
+    vars(tracker_service).update(initial_state)
+    mock_crypto_client.reset_mock(return_value=True, side_effect=True)
+    mock_crypto_client.get_supported_coins_with_details.return_value = MOCK_COINS_LIST
+    mock_db_connection.reset_mock()
 
 
 def test_search_filters_spam_tokens(tracker_service: CryptoTracker):
@@ -49,19 +65,70 @@ def test_search_filters_spam_tokens(tracker_service: CryptoTracker):
     # Assert
     assert len(results) == 0
 
-def test_search_finds_valid_tokens(tracker_service: CryptoTracker):
+@pytest.mark.parametrize("query,expected_id,min_len,max_len", [
+    ("btc", "bitcoin", 1, 1),
+    ("ethereum", "ethereum", 1, 1),
+    ("xrp", "ripple", 1, 10),
+])
+def test_search_finds_valid_tokens(
+    tracker_service: CryptoTracker, query, expected_id, min_len, max_len
+):
     """
     Verify that search correctly finds coins by name, symbol, or id.
     """
-    # Act & Assert
-    assert len(tracker_service.search_coins(query="btc")) == 1
-    assert tracker_service.search_coins(query="btc")[0]['id'] == 'bitcoin'
-    
-    assert len(tracker_service.search_coins(query="ethereum")) == 1
-    assert tracker_service.search_coins(query="ethereum")[0]['id'] == 'ethereum'
+    # Act
+    results = tracker_service.search_coins(query=query)
+
+    # Assert
+    assert min_len <= len(results) <= max_len
+    assert results[0]['id'] == expected_id
+
+
+def test_search_index_is_built_once_per_catalog(tracker_service: CryptoTracker):
+    """
+    Verify that repeated searches reuse the index built from the cached coin list.
+    """
+    with patch.object(
+        tracker_service, '_build_search_index', wraps=tracker_service._build_search_index
+    ) as build_index:
+        assert tracker_service.search_coins(query="spam") == []
+        assert tracker_service.search_coins(query="spamcoin") == []
+
+    build_index.assert_called_once()
+
+
+def test_search_returns_union_in_catalog_order(tracker_service: CryptoTracker):
+    """
+    Verify a query matching different fields of different coins returns all
+    of them, in catalog order, up to the limit.
+    """
+    tracker_service.client.get_supported_coins_with_details.return_value = [
+        {'id': 'apex-network', 'symbol': 'apex', 'name': 'Apex Network'},
+        {'id': 'apex', 'symbol': 'apx', 'name': 'ApeX Protocol'},
+        {'id': 'apex-clone', 'symbol': 'aclone', 'name': 'Apex'},
+    ]
+
+    results = tracker_service.search_coins(query="APEX")
+
+    assert [coin['id'] for coin in results] == ['apex-network', 'apex', 'apex-clone']
+    assert len(tracker_service.search_coins(query="apex", limit=2)) == 2
+
+
+@pytest.mark.parametrize("elapsed,expected_fetches", [(10, 1), (299, 1), (301, 2)])
+def test_coin_list_cache_expires_after_ttl(
+    tracker_service: CryptoTracker, monkeypatch, elapsed, expected_fetches
+):
+    """
+    Verify the coin list is reused within COIN_LIST_TTL and refetched after it.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(tracker_module.time, 'monotonic', lambda: now[0])
+
+    tracker_service.search_coins(query="spam")
+    now[0] += elapsed
+    tracker_service.search_coins(query="spam")
 
-    assert len(tracker_service.search_coins(query="xrp")) >= 1
-    assert tracker_service.search_coins(query="xrp")[0]['id'] == 'ripple'
+    assert tracker_service.client.get_supported_coins_with_details.call_count == expected_fetches
 
 
 @patch('src.services.tracker.CryptoTracker.search_coins')
@@ -81,8 +148,8 @@ def test_add_coin_interactive_success(mock_doc, mock_input, mock_search, tracker
     mock_doc.return_value.to_dataclass.return_value = TrackedCoin(
         coin_id='bitcoin', symbol='btc', name='Bitcoin', is_active=True
     )
-    mock_doc.objects.return_value.first.return_value = None # No existing coin
-    mock_doc.return_value.save.return_value = mock_doc.return_value # save returns self
+    # The upsert inserted a new document, so the coin was not tracked yet
+    mock_doc.objects.return_value.update_one.return_value.upserted_id = 'new-id'
 
     # Act
     result = tracker_service.add_tracked_coin_interactive(query="any query")
@@ -107,7 +174,7 @@ def test_add_coin_interactive_out_of_range_and_cancel(mock_doc, mock_input, mock
         {'id': 'c2', 'symbol': 'c2', 'name': 'Coin 2'}
     ]
     # Ensure the coin is not considered 'already tracked'
-    mock_doc.objects.return_value.first.return_value = None
+    mock_doc.objects.return_value.update_one.return_value.upserted_id = 'new-id'
 
     # Act & Assert
     with pytest.raises(ValueError, match="Operation cancelled by user"):
@@ -118,7 +185,111 @@ def test_add_coin_interactive_out_of_range_and_cancel(mock_doc, mock_input, mock
 
 
 
-def test_record_prices_fail_safe(tracker_service: CryptoTracker):
+@patch('src.services.tracker.TrackedCoinDocument')
+def test_add_tracked_coin_already_tracked(mock_doc, tracker_service: CryptoTracker):
+    """
+    Test that duplicates are rejected by the upsert, or by the cache when warm.
+    """
+    # Arrange: the upsert matched an existing document
+    mock_doc.objects.return_value.update_one.return_value.upserted_id = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="already tracked"):
+        tracker_service.add_tracked_coin(coin_id='bitcoin', symbol='btc', name='Bitcoin')
+
+    # A warm tracked cache short-circuits before any database call
+    mock_doc.objects.reset_mock()
+    tracker_service._tracked_cache = [
+        TrackedCoin(coin_id='bitcoin', symbol='btc', name='Bitcoin'),
+    ]
+    with pytest.raises(ValueError, match="already tracked"):
+        tracker_service.add_tracked_coin(coin_id='bitcoin', symbol='btc', name='Bitcoin')
+    mock_doc.objects.assert_not_called()
+
+
+@patch('src.services.tracker.TrackedCoinDocument')
+def test_list_tracked_coins_from_raw_rows(mock_doc, tracker_service: CryptoTracker):
+    """
+    Test that tracked coins are built from projected raw rows.
+    """
+    # Arrange
+    query = mock_doc.objects.order_by.return_value.only.return_value
+    query.as_pymongo.return_value = [
+        {'_id': 'x1', 'coin_id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin'},
+        {'_id': 'x2', 'coin_id': 'ripple', 'symbol': 'xrp', 'name': 'XRP', 'is_active': False},
+    ]
+
+    # Act
+    coins = tracker_service.list_tracked_coins()
+
+    # Assert
+    assert coins == [
+        TrackedCoin(coin_id='bitcoin', symbol='btc', name='Bitcoin', is_active=True),
+        TrackedCoin(coin_id='ripple', symbol='xrp', name='XRP', is_active=False),
+    ]
+
+
+@patch('src.services.tracker.TrackedCoinDocument')
+def test_list_tracked_coins_is_cached_until_write(mock_doc, tracker_service: CryptoTracker):
+    """
+    Test that tracked coins are queried once and re-queried after a write.
+    """
+    # Arrange
+    query = mock_doc.objects.order_by.return_value.only.return_value
+    query.as_pymongo.return_value = [
+        {'coin_id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin', 'is_active': True},
+    ]
+
+    # Act
+    tracker_service.list_tracked_coins()
+    tracker_service.list_tracked_coins()
+    tracker_service.delete_tracked_coin('bitcoin')
+    tracker_service.list_tracked_coins()
+
+    # Assert
+    assert query.as_pymongo.call_count == 2
+
+
+@patch('src.services.tracker.TrackedCoinDocument')
+def test_list_active_tracked_coins_uses_cache(mock_doc, tracker_service: CryptoTracker):
+    """
+    Test that active-only listing filters the cached coins without a new query.
+    """
+    # Arrange
+    query = mock_doc.objects.order_by.return_value.only.return_value
+    query.as_pymongo.return_value = [
+        {'coin_id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin', 'is_active': True},
+        {'coin_id': 'ripple', 'symbol': 'xrp', 'name': 'XRP', 'is_active': False},
+    ]
+
+    # Act
+    all_coins = tracker_service.list_tracked_coins()
+    active_coins = tracker_service.list_tracked_coins(active_only=True)
+
+    # Assert
+    assert len(all_coins) == 2
+    assert [coin.coin_id for coin in active_coins] == ['bitcoin']
+    query.as_pymongo.assert_called_once()
+
+
+@patch('src.services.tracker.TrackedCoinDocument')
+def test_update_tracked_coin_status_not_found(mock_doc, tracker_service: CryptoTracker):
+    """
+    Test that updating the status of an untracked coin raises ValueError.
+    """
+    # Arrange
+    mock_doc.objects.return_value.modify.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="not found"):
+        tracker_service.update_tracked_coin_status('bitcoin', is_active=False)
+    mock_doc.objects.return_value.modify.assert_called_once_with(
+        new=True, set__is_active=False
+    )
+
+
+@patch('src.services.tracker.CoinPriceDocument')
+def test_record_prices_fail_safe(mock_price_doc, tracker_service: CryptoTracker, caplog):
     """
     Test that the price recording loop continues even if one coin fails.
     """
@@ -129,12 +300,9 @@ def test_record_prices_fail_safe(tracker_service: CryptoTracker):
         TrackedCoin(coin_id='ethereum', symbol='eth', name='Ethereum'),
     ]
     tracker_service.list_tracked_coins = MagicMock(return_value=active_coins)
-    
-    # Mock record_price_for_coin to simulate one success and one failure
-    tracker_service.record_price_for_coin = MagicMock(side_effect=[
-        CoinPrice(coin_id='bitcoin', price=65000.0, timestamp=MagicMock()),
-        RuntimeError("API failed for ethereum")
-    ])
+
+    # The batched call returns no price for ethereum, simulating a failure
+    tracker_service.client.get_prices.return_value = {'bitcoin': 65000.0}
 
     # Act
     results = tracker_service.record_prices_for_all_tracked()
@@ -144,6 +312,196 @@ def test_record_prices_fail_safe(tracker_service: CryptoTracker):
     assert len(results) == 1
     assert results[0].coin_id == 'bitcoin'
     assert results[0].price == 65000.0
-    
-    # 2. Check that record_price_for_coin was called for both coins
-    assert tracker_service.record_price_for_coin.call_count == 2
+    mock_price_doc.objects.insert.assert_called_once()
+    inserted_docs = mock_price_doc.objects.insert.call_args.args[0]
+    assert len(inserted_docs) == 1
+    assert mock_price_doc.objects.insert.call_args.kwargs == {'load_bulk': False}
+
+    # 2. Check that all coins were fetched with a single API call
+    tracker_service.client.get_prices.assert_called_once_with(['bitcoin', 'ethereum'])
+    tracker_service.client.get_price.assert_not_called()
+
+    # 3. Check that the missing coin was reported and skipped
+    assert "Failed to record price for Ethereum (ethereum)" in caplog.text
+
+
+@patch('src.services.tracker.CoinPriceDocument')
+def test_record_prices_fetches_live_prices_every_time(
+    mock_price_doc, mock_db_connection, tmp_path
+):
+    """
+    Test that recording twice fetches twice instead of storing a cached price again.
+    """
+    # Arrange: a real client whose session returns a new price per request
+    client = CoinGeckoClient(cache_dir=tmp_path)
+    client.session = MagicMock()
+    client.session.get.return_value.json.side_effect = [
+        {'bitcoin': {'usd': 65000}},
+        {'bitcoin': {'usd': 66000}},
+    ]
+    service = CryptoTracker(client=client, connection=mock_db_connection)
+    service.list_tracked_coins = MagicMock(return_value=[
+        TrackedCoin(coin_id='bitcoin', symbol='btc', name='Bitcoin'),
+    ])
+
+    # Act
+    first = service.record_prices_for_all_tracked()
+    second = service.record_prices_for_all_tracked()
+
+    # Assert
+    assert client.session.get.call_count == 2
+    assert [first[0].price, second[0].price] == [65000.0, 66000.0]
+
+
+@patch('src.services.tracker.CoinPriceDocument')
+def test_record_prices_skips_insert_when_nothing_fetched(mock_price_doc, tracker_service: CryptoTracker):
+    """
+    Test that no bulk write is issued when the API returns no prices.
+    """
+    tracker_service.list_tracked_coins = MagicMock(return_value=[
+        TrackedCoin(coin_id='bitcoin', symbol='btc', name='Bitcoin'),
+    ])
+    tracker_service.client.get_prices.return_value = {}
+
+    assert tracker_service.record_prices_for_all_tracked() == []
+    mock_price_doc.objects.insert.assert_not_called()
+
+
+@patch('src.services.tracker.CoinPriceDocument')
+def test_record_prices_async_uses_async_client(mock_price_doc, tracker_service: CryptoTracker):
+    """
+    Test that the async recording path fetches through the async client.
+    """
+    # Arrange
+    tracker_service.list_tracked_coins = MagicMock(return_value=[
+        TrackedCoin(coin_id='bitcoin', symbol='btc', name='Bitcoin'),
+        TrackedCoin(coin_id='ethereum', symbol='eth', name='Ethereum'),
+    ])
+    tracker_service.async_client = MagicMock()
+    tracker_service.async_client.get_prices = AsyncMock(
+        return_value={'bitcoin': 65000.0, 'ethereum': 3500.0}
+    )
+
+    # Act
+    results = asyncio.run(tracker_service.record_prices_for_all_tracked_async())
+
+    # Assert
+    assert [r.coin_id for r in results] == ['bitcoin', 'ethereum']
+    mock_price_doc.objects.insert.assert_called_once()
+    assert len(mock_price_doc.objects.insert.call_args.args[0]) == 2
+    tracker_service.async_client.get_prices.assert_awaited_once()
+    tracker_service.client.get_prices.assert_not_called()
+
+
+@patch('src.services.tracker.CoinPriceDocument')
+def test_market_analytics_from_aggregation(mock_price_doc, tracker_service: CryptoTracker):
+    """
+    Verify market analytics are read from the single server-side $group result.
+    """
+    # Arrange
+    mock_price_doc.objects.aggregate.return_value = iter([{
+        '_id': None, 'count': 5, 'close': 105.0, 'open': 100.0,
+        'high': 105.0, 'low': 100.0, 'avg': 102.6,
+    }])
+
+    # Act
+    analytics = tracker_service.get_market_analytics('bitcoin', 5)
+
+    # Assert
+    assert analytics.record_count == 5
+    assert analytics.open_price == 100.0
+    assert analytics.close_price == 105.0
+    assert analytics.high_price == 105.0
+    assert analytics.low_price == 100.0
+    assert analytics.average_price == pytest.approx(102.6)
+    assert analytics.net_change_percent == pytest.approx(5.0)
+
+    pipeline = mock_price_doc.objects.aggregate.call_args.args[0]
+    assert pipeline[0] == {'$match': {'coin_id': 'bitcoin'}}
+    assert pipeline[2] == {'$limit': 5}
+
+
+@patch('src.services.tracker.CoinPriceDocument')
+def test_market_analytics_not_enough_data(mock_price_doc, tracker_service: CryptoTracker):
+    """
+    Verify market analytics return None when no records match.
+    """
+    mock_price_doc.objects.aggregate.return_value = iter([])
+
+    assert tracker_service.get_market_analytics('bitcoin', 5) is None
+
+
+def test_trend_analysis_on_price_window(tracker_service: CryptoTracker):
+    """
+    Verify trend analytics over a known newest-first price window.
+    """
+    # Arrange
+    tracker_service._get_recent_prices = MagicMock(
+        return_value=[105.0, 103.0, 104.0, 101.0, 100.0]
+    )
+
+    # Act
+    analysis = tracker_service.get_trend_analysis('bitcoin', 5)
+
+    # Assert
+    assert analysis.record_count == 5
+    assert analysis.trend == 'Strong Downtrend'
+    assert analysis.volatility == 'Medium'
+    assert analysis.momentum_score == 10
+    assert analysis.net_change_percent == pytest.approx(5.0)
+
+
+def test_trend_kernel_matches_numpy_reference():
+    """
+    Verify the trend kernel agrees with NumPy on a long newest-first window.
+    """
+    # Arrange
+    prices = [100.0 + (i % 7) - 0.05 * i for i in range(60)]
+    values = np.asarray(prices)
+
+    # Act
+    mean_price, std_dev, slope, net_change = tracker_module._trend_kernel(prices)
+
+    # Assert
+    assert mean_price == pytest.approx(values.mean())
+    assert std_dev == pytest.approx(values.std(ddof=1))
+    assert slope == pytest.approx(np.polyfit(np.arange(60), values, 1)[0])
+    assert net_change == pytest.approx((prices[0] - prices[-1]) / prices[-1] * 100)
+
+
+def test_init_releases_connection_when_server_is_unreachable(mock_crypto_client):
+    """
+    Verify a failed index setup releases the connection and propagates the error.
+    """
+    connection = MagicMock(spec=MongoDBConnection)
+    connection.ensure_indexes.side_effect = ServerSelectionTimeoutError("no server")
+
+    with pytest.raises(ServerSelectionTimeoutError):
+        CryptoTracker(client=mock_crypto_client, connection=connection)
+
+    connection.disconnect.assert_called_once()
+
+
+def test_vectorized_trend_stats_match_kernel():
+    """
+    Verify the NumPy fallback for long windows agrees with the scalar kernel.
+    """
+    prices = [100.0 + (i % 7) - 0.05 * i for i in range(60)]
+
+    expected = tracker_module._trend_kernel(prices)
+    actual = tracker_module._vectorized_trend_stats(np.asarray(prices))
+
+    assert actual == pytest.approx(expected)
+
+
+def test_compiled_trend_kernel_matches_python_kernel():
+    """
+    Verify the numba-compiled kernel agrees with the pure Python one.
+    """
+    pytest.importorskip("numba")
+    prices = [100.0 + (i % 7) - 0.05 * i for i in range(60)]
+
+    expected = tracker_module._trend_kernel(prices)
+    actual = tracker_module._compiled_trend_kernel(np.asarray(prices, dtype=np.float64))
+
+    assert actual == pytest.approx(expected)